@@ -26,10 +26,16 @@ def build(dataset_config,
         from nuscenes import NuScenes
         nusc = NuScenes(version='v1.0-trainval', dataroot=data_path, verbose=True)
 
+    pc_dataset_kwargs = {}
+    if dataset_config['pc_dataset_type'] == 'SemKITTI_sk':
+        pc_dataset_kwargs['reuse_buffers'] = dataset_config.get('reuse_buffers', False)
+
     train_pt_dataset = SemKITTI(data_path, imageset=train_imageset,
-                                return_ref=train_ref, label_mapping=label_mapping, nusc=nusc)
+                                return_ref=train_ref, label_mapping=label_mapping, nusc=nusc,
+                                **pc_dataset_kwargs)
     val_pt_dataset = SemKITTI(data_path, imageset=val_imageset,
-                              return_ref=val_ref, label_mapping=label_mapping, nusc=nusc)
+                              return_ref=val_ref, label_mapping=label_mapping, nusc=nusc,
+                              **pc_dataset_kwargs)
 
     train_dataset = get_model_class(dataset_config['dataset_type'])(
         train_pt_dataset,
@@ -3,7 +3,7 @@
 
 from pathlib import Path
 
-from strictyaml import Bool, Float, Int, Map, Seq, Str, as_document, load
+from strictyaml import Bool, Float, Int, Map, Optional, Seq, Str, as_document, load
 
 model_params = Map(
     {
@@ -28,6 +28,7 @@ dataset_params = Map(
         "label_mapping": Str(),
         "max_volume_space": Seq(Float()),
         "min_volume_space": Seq(Float()),
+        Optional("reuse_buffers", default=False): Bool(),
     }
 )
 
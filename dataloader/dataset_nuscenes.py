@@ -50,9 +50,10 @@ class cylinder_dataset_nuscenes(data.Dataset):
         data = self.point_cloud_dataset[index]
         if len(data) == 2:
             xyz, labels = data
+            sig = None
         elif len(data) == 3:
             xyz, labels, sig = data
-            if len(sig.shape) == 2: sig = np.squeeze(sig)
+            if sig is not None and len(sig.shape) == 2: sig = np.squeeze(sig)
         else:
             raise Exception('Return invalid data tuple')
 
@@ -122,9 +123,9 @@ class cylinder_dataset_nuscenes(data.Dataset):
         return_xyz = xyz_pol - voxel_centers
         return_xyz = np.concatenate((return_xyz, xyz_pol, xyz[:, :2]), axis=1)
 
-        if len(data) == 2:
+        if sig is None:
             return_fea = return_xyz
-        elif len(data) == 3:
+        else:
             return_fea = np.concatenate((return_xyz, sig[..., np.newaxis]), axis=1)
 
         if self.return_test:
@@ -56,9 +56,10 @@ class voxel_dataset(data.Dataset):
         data = self.point_cloud_dataset[index]
         if len(data) == 2:
             xyz, labels = data
+            sig = None
         elif len(data) == 3:
             xyz, labels, sig = data
-            if len(sig.shape) == 2: sig = np.squeeze(sig)
+            if sig is not None and len(sig.shape) == 2: sig = np.squeeze(sig)
         else:
             raise Exception('Return invalid data tuple')
 
@@ -114,9 +115,9 @@ class voxel_dataset(data.Dataset):
         return_xyz = xyz - voxel_centers
         return_xyz = np.concatenate((return_xyz, xyz), axis=1)
 
-        if len(data) == 2:
+        if sig is None:
             return_fea = return_xyz
-        elif len(data) == 3:
+        else:
             return_fea = np.concatenate((return_xyz, sig[..., np.newaxis]), axis=1)
 
         if self.return_test:
@@ -192,9 +193,10 @@ class cylinder_dataset(data.Dataset):
         data = self.point_cloud_dataset[index]
         if len(data) == 2:
             xyz, labels = data
+            sig = None
         elif len(data) == 3:
             xyz, labels, sig = data
-            if len(sig.shape) == 2: sig = np.squeeze(sig)
+            if sig is not None and len(sig.shape) == 2: sig = np.squeeze(sig)
         else:
             raise Exception('Return invalid data tuple')
         # random data augmentation by rotation
@@ -252,7 +254,6 @@ class cylinder_dataset(data.Dataset):
         voxel_position = polar2cat(voxel_position)
 
         processed_label = np.ones(self.grid_size, dtype=np.uint8) * self.ignore_label
-        print(processed_label)
         label_voxel_pair = np.concatenate([grid_ind, labels], axis=1)
         label_voxel_pair = label_voxel_pair[np.lexsort((grid_ind[:, 0], grid_ind[:, 1], grid_ind[:, 2])), :]
         processed_label = nb_process_label(np.copy(processed_label), label_voxel_pair)
@@ -262,9 +263,9 @@ class cylinder_dataset(data.Dataset):
         voxel_centers = (grid_ind.astype(np.float32) + 0.5) * intervals + min_bound
         return_xyz = xyz_pol - voxel_centers
         return_xyz = np.concatenate((return_xyz, xyz_pol, xyz[:, :2]), axis=1)
-        if len(data) == 2:
+        if sig is None:
             return_fea = return_xyz
-        elif len(data) == 3:
+        else:
             return_fea = np.concatenate((return_xyz, sig[..., np.newaxis]), axis=1)
 
         if self.return_test:
@@ -299,9 +300,10 @@ class polar_dataset(data.Dataset):
         data = self.point_cloud_dataset[index]
         if len(data) == 2:
             xyz, labels = data
+            sig = None
         elif len(data) == 3:
             xyz, labels, sig = data
-            if len(sig.shape) == 2:
+            if sig is not None and len(sig.shape) == 2:
                 sig = np.squeeze(sig)
         else:
             raise Exception('Return invalid data tuple')
@@ -362,9 +364,9 @@ class polar_dataset(data.Dataset):
         return_xyz = xyz_pol - voxel_centers
         return_xyz = np.concatenate((return_xyz, xyz_pol, xyz[:, :2]), axis=1)
 
-        if len(data) == 2:
+        if sig is None:
             return_fea = return_xyz
-        elif len(data) == 3:
+        else:
             return_fea = np.concatenate((return_xyz, sig[..., np.newaxis]), axis=1)
 
         if self.return_test:
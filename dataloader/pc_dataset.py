@@ -3,13 +3,27 @@
 # @file: pc_dataset.py 
 
 import os
+import functools
+import collections
 import numpy as np
+import numba as nb
 from torch.utils import data
 import yaml
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pyyaml built without libyaml
+    from yaml import SafeLoader as YamlLoader
 import pickle
+import tempfile
 import h5py
 REGISTERED_PC_DATASET_CLASSES = {}
 
+# what every point cloud dataset returns; ref is None unless return_ref is set
+Sample = collections.namedtuple('Sample', 'xyz label ref')
+
+# imageset argument -> key under 'split' in the label mapping yaml
+SPLIT_NAMES = {'train': 'train', 'val': 'valid', 'test': 'test'}
+
 
 def register_dataset(cls, name=None):
     global REGISTERED_PC_DATASET_CLASSES
@@ -29,43 +43,112 @@ def get_pc_model_class(name):
 @register_dataset
 class SemKITTI_sk(data.Dataset):
     def __init__(self, data_path, imageset='train',
-                 return_ref=False, label_mapping="semantic-kitti.yaml", nusc=None):
+                 return_ref=False, label_mapping="semantic-kitti.yaml", nusc=None, reuse_buffers=False):
         self.return_ref = return_ref
+        self.reuse_buffers = reuse_buffers
         with open(label_mapping, 'r') as stream:
-            semkittiyaml = yaml.safe_load(stream)
+            semkittiyaml = yaml.load(stream, Loader=YamlLoader)
         self.learning_map = semkittiyaml['learning_map']
+        # covers every uint16 label, nb_assemble_points does no bounds checking
+        self.learning_map_lut = build_learning_map_lut(self.learning_map, size=1 << 16)
         self.imageset = imageset
-        if imageset == 'train':
-            split = semkittiyaml['split']['train']
-        elif imageset == 'val':
-            split = semkittiyaml['split']['valid']
-        elif imageset == 'test':
-            split = semkittiyaml['split']['test']
-        else:
+        if imageset not in SPLIT_NAMES:
             raise Exception('Split must be train/val/test')
+        split = semkittiyaml['split'][SPLIT_NAMES[imageset]]
 
-        self.im_idx = []
-        for i_folder in split:
-            self.im_idx += absoluteFilePaths('/'.join([data_path, str(i_folder).zfill(2), 'velodyne']))
+        self.im_idx, self.counts = self._load_index(data_path, split)
+
+        # xyz/ref buffers shared by consecutive samples when reuse_buffers is set, see _point_buffers
+        self._buf_xyz = None
+        self._buf_ref = None
 
     def __len__(self):
         'Denotes the total number of samples'
         return len(self.im_idx)
 
+    def _load_index(self, data_path, split):
+        # file list and per scan point counts (4 float32 per point) are cached beside the data, with
+        # paths relative to data_path; the cache is rebuilt when the split, a velodyne folder (scans
+        # added or removed) or the size of any cached scan (rewritten in place) changes
+        data_path = os.path.abspath(data_path)
+        folders = ['/'.join([data_path, str(i_folder).zfill(2), 'velodyne']) for i_folder in split]
+        mtimes = [os.path.getmtime(folder) if os.path.isdir(folder) else None for folder in folders]
+        cache_path = os.path.join(data_path, '.index_%s.pkl' % self.imageset)
+        cache = None
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    cache = pickle.load(f)
+            except Exception:
+                cache = None  # unreadable or truncated cache, rebuild it
+        if (isinstance(cache, dict) and cache.get('split') == list(split) and cache.get('mtimes') == mtimes
+                and 'im_idx' in cache and 'counts' in cache):
+            im_idx = [os.path.join(data_path, path) for path in cache['im_idx']]
+            try:
+                counts = np.array([os.stat(path).st_size // 16 for path in im_idx], dtype=np.int64)
+            except OSError:
+                counts = None  # a cached scan disappeared
+            if counts is not None and np.array_equal(counts, cache['counts']):
+                return im_idx, counts
+
+        im_idx = []
+        for folder in folders:
+            im_idx.extend(absoluteFilePaths(folder))
+        counts = np.array([os.stat(path).st_size // 16 for path in im_idx], dtype=np.int64)
+
+        if im_idx:
+            try:
+                # unique temp file, so concurrent processes building the cache cannot interleave writes
+                fd, tmp_path = tempfile.mkstemp(dir=data_path, prefix='.index_%s.' % self.imageset)
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        pickle.dump({'split': list(split), 'mtimes': mtimes, 'counts': counts,
+                                     'im_idx': [os.path.relpath(path, data_path) for path in im_idx]}, f)
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+            except OSError:
+                pass  # read-only dataset location, walk again next time
+        return im_idx, counts
+
+    def _point_buffers(self, num_points):
+        # every DataLoader worker holds its own copy of the dataset, so these buffers are per worker.
+        # only xyz and ref come from the pool: the wrapping voxel datasets consume them before the
+        # next sample is read, whereas the labels are handed on to collate_fn_BEV without a copy
+        if not self.reuse_buffers:
+            return np.empty((num_points, 3), dtype=np.float32), np.empty((num_points,), dtype=np.float32)
+        if self._buf_xyz is None or self._buf_xyz.shape[0] < num_points:
+            capacity = num_points if self._buf_xyz is None else max(num_points, int(self._buf_xyz.shape[0] * 1.5))
+            capacity = max(capacity, 200000)
+            self._buf_xyz = np.empty((capacity, 3), dtype=np.float32)
+            self._buf_ref = np.empty((capacity,), dtype=np.float32)
+        return self._buf_xyz[:num_points], self._buf_ref[:num_points]
+
     def __getitem__(self, index):
-        raw_data = np.fromfile(self.im_idx[index], dtype=np.float32).reshape((-1, 4))
+        'With reuse_buffers, the returned xyz and ref are overwritten by the next call: consume or copy them first'
+        label_path = self.im_idx[index].replace('velodyne', 'labels')[:-3] + 'label'
+        prefetch_files([self.im_idx[index]] if self.imageset == 'test' else [self.im_idx[index], label_path])
+
+        # copy-on-write mappings are served from the page cache and, unlike mode='r', stay
+        # writable arrays as the numba signature below expects; nothing is written to them
+        raw_data = np.asarray(np.memmap(self.im_idx[index], dtype=np.float32, mode='c')).reshape((-1, 4))
         if self.imageset == 'test':
-            annotated_data = np.expand_dims(np.zeros_like(raw_data[:, 0], dtype=int), axis=1)
+            point_label = np.zeros(raw_data.shape[0], dtype=np.uint16)
+            learning_map_lut = ZERO_LABEL_LUT
         else:
-            annotated_data = np.fromfile(self.im_idx[index].replace('velodyne', 'labels')[:-3] + 'label',
-                                         dtype=np.int32).reshape((-1, 1))
-            annotated_data = annotated_data & 0xFFFF  # delete high 16 digits binary
-            annotated_data = np.vectorize(self.learning_map.__getitem__)(annotated_data)
+            # each little-endian int32 label is (semantic uint16, instance uint16): keep the low half only
+            point_label = np.asarray(np.memmap(label_path, dtype=np.uint16, mode='c')).reshape((-1, 2))[:, 0]
+            learning_map_lut = self.learning_map_lut
+            # nb_assemble_points indexes the labels by point without bounds checking
+            if point_label.shape[0] != raw_data.shape[0]:
+                raise Exception('%s has %d labels for %d points' % (label_path, point_label.shape[0], raw_data.shape[0]))
+
+        xyz, ref = self._point_buffers(raw_data.shape[0])
+        annotated_data = np.empty((raw_data.shape[0],), dtype=np.uint8)
+        nb_assemble_points(raw_data, point_label, learning_map_lut, xyz, ref, annotated_data)
 
-        data_tuple = (raw_data[:, :3], annotated_data.astype(np.uint8))
-        if self.return_ref:
-            data_tuple += (raw_data[:, 3],)
-        return data_tuple
+        return Sample(xyz, annotated_data.reshape((-1, 1)), ref if self.return_ref else None)
 
 @register_dataset
 class Dense(data.Dataset):
@@ -73,47 +156,31 @@ class Dense(data.Dataset):
                  return_ref=True, label_mapping="dense.yaml", nusc=None):
         self.return_ref = return_ref
         with open(label_mapping, 'r') as stream:
-            semkittiyaml = yaml.safe_load(stream)
+            semkittiyaml = yaml.load(stream, Loader=YamlLoader)
         self.learning_map = semkittiyaml['learning_map']
+        self.learning_map_lut = build_learning_map_lut(self.learning_map)
         self.imageset = imageset
-        if imageset == 'train':
-            split = semkittiyaml['split']['train']
-        elif imageset == 'val':
-            split = semkittiyaml['split']['valid']
-        elif imageset == 'test':
-            split = semkittiyaml['split']['test']
-        else:
+        if imageset not in SPLIT_NAMES:
             raise Exception('Split must be train/val/test')
+        split = semkittiyaml['split'][SPLIT_NAMES[imageset]]
 
         self.im_idx = []
         for i_folder in split:
-            self.im_idx += absoluteFilePaths('/'.join([data_path, i_folder]))
+            self.im_idx.extend(absoluteFilePaths('/'.join([data_path, i_folder])))
     def __len__(self):
         'Denotes the total number of samples'
         return len(self.im_idx)
 
     def __getitem__(self, index):
-        with h5py.File(self.im_idx[index], "r") as f:
-            raw_data = np.dstack(
-                (np.array(
-                    f["sensorX_1"]), np.array(
-                    f["sensorY_1"]), np.array(
-                    f["sensorZ_1"]), np.array(
-                    f['distance_m_1']), np.array(
-                    f['intensity_1']), np.array(
-                    f['labels_1']
-                )))
-            raw_data = raw_data.astype(np.float32).transpose(2,0,1).reshape(6,-1)
+        with open_dense_file(self.im_idx[index]) as f:
+            xyz, raw_data = read_dense_fields(f)
             if self.imageset == 'test':
-                annotated_data = np.expand_dims(np.zeros_like(raw_data[:, 0], dtype=int), axis=1)
+                annotated_data = np.expand_dims(np.zeros_like(xyz[:, 0], dtype=np.uint8), axis=1)
             else:
-                annotated_data = raw_data[5,:].astype(np.int32).reshape(-1,1)
+                annotated_data = raw_data[2,:].astype(np.int32).reshape(-1,1)
                 annotated_data = annotated_data & 0xFFFF  # delete high 16 digits binary
-                annotated_data = np.vectorize(self.learning_map.__getitem__)(annotated_data)
-            data_tuple = (raw_data[:3,:].transpose(1,0), annotated_data.astype(np.uint8))
-            if self.return_ref:
-                data_tuple += (raw_data[3, :].reshape(-1,1),)
-            return data_tuple
+                annotated_data = self.learning_map_lut[annotated_data]
+            return Sample(xyz, annotated_data, raw_data[0, :].reshape(-1,1) if self.return_ref else None)
 
 @register_dataset
 class CycleDense(data.Dataset):
@@ -121,49 +188,24 @@ class CycleDense(data.Dataset):
                  return_ref=True, label_mapping="cycledense.yaml", nusc=None):
         self.return_ref = return_ref
         with open(label_mapping, 'r') as stream:
-            semkittiyaml = yaml.safe_load(stream)
+            semkittiyaml = yaml.load(stream, Loader=YamlLoader)
         self.learning_map = semkittiyaml['learning_map']
+        self.learning_map_lut = build_learning_map_lut(self.learning_map)
         self.imageset = imageset
-        if imageset+clss == 'trainclear':
-            split = semkittiyaml['split']['trainclear']
-        elif imageset+clss == 'trainrain':
-            split = semkittiyaml['split']['trainrain']
-        elif imageset+clss == 'trainfog':
-            split = semkittiyaml['split']['trainfog']
-        elif imageset+clss == 'valclear':
-            split = semkittiyaml['split']['valclear']
-        elif imageset+clss == 'valrain':
-            split = semkittiyaml['split']['valrain']
-        elif imageset+clss == 'valfog':
-            split = semkittiyaml['split']['valfog']
-        elif imageset+clss == 'testclear':
-            split = semkittiyaml['split']['testclear']
-        elif imageset+clss == 'testrain':
-            split = semkittiyaml['split']['testrain']
-        elif imageset+clss == 'testfog':
-            split = semkittiyaml['split']['testfog']
-        else:
+        if imageset not in SPLIT_NAMES or clss not in ('clear', 'rain', 'fog'):
             raise Exception('Split must be train/val/test with class clear/rain/fog')
+        split = semkittiyaml['split'][imageset + clss]
 
         self.im_idx = []
         for i_folder in split:
-            self.im_idx += absoluteFilePaths('/'.join([data_path, i_folder]))
+            self.im_idx.extend(absoluteFilePaths('/'.join([data_path, i_folder])))
     def __len__(self):
         'Denotes the total number of samples'
         return len(self.im_idx)
 
     def __getitem__(self, index):
-        with h5py.File(self.im_idx[index], "r") as f:
-            raw_data = np.dstack(
-                (np.array(
-                    f["sensorX_1"]), np.array(
-                    f["sensorY_1"]), np.array(
-                    f["sensorZ_1"]), np.array(
-                    f['distance_m_1']), np.array(
-                    f['intensity_1']), np.array(
-                    f['labels_1']
-                )))
-            raw_data = raw_data.astype(np.float32).transpose(2,0,1).reshape(6,-1)
+        with open_dense_file(self.im_idx[index]) as f:
+            xyz, raw_data = read_dense_fields(f)
             # if self.imageset == 'test':
             #     annotated_data = np.expand_dims(np.zeros_like(raw_data[:, 0], dtype=int), axis=1)
             # else:
@@ -171,12 +213,7 @@ class CycleDense(data.Dataset):
             #     annotated_data = annotated_data & 0xFFFF  # delete high 16 digits binary
             #     annotated_data = np.vectorize(self.learning_map.__getitem__)(annotated_data)
             # data_tuple = (raw_data[:3,:].transpose(1,0), annotated_data.astype(np.uint8))
-            data_tuple = (raw_data[:3,:].transpose(1,0),)
-
-            if self.return_ref:
-                data_tuple += (raw_data[3, :].reshape(-1,1),)
-                print(len(data_tuple))
-            return data_tuple
+            return Sample(xyz, None, raw_data[0, :].reshape(-1,1) if self.return_ref else None)
 
 @register_dataset
 class SemKITTI_nusc(data.Dataset):
@@ -188,38 +225,141 @@ class SemKITTI_nusc(data.Dataset):
             data = pickle.load(f)
 
         with open(label_mapping, 'r') as stream:
-            nuscenesyaml = yaml.safe_load(stream)
+            nuscenesyaml = yaml.load(stream, Loader=YamlLoader)
         self.learning_map = nuscenesyaml['learning_map']
+        # lidarseg labels are uint8, so a 256 entry table covers every possible value
+        self.learning_map_lut = build_learning_map_lut(self.learning_map, size=256)
 
         self.nusc_infos = data['infos']
         self.data_path = data_path
         self.nusc = nusc
 
+        # resolve (lidar, lidarseg) file pairs once instead of querying the nuScenes tables per sample
+        self.paths = []
+        for info in self.nusc_infos:
+            lidar_sd_token = nusc.get('sample', info['token'])['data']['LIDAR_TOP']
+            self.paths.append((os.path.join(data_path, info['lidar_path'][16:]),
+                               os.path.join(nusc.dataroot, nusc.get('lidarseg', lidar_sd_token)['filename'])))
+
     def __len__(self):
         'Denotes the total number of samples'
         return len(self.nusc_infos)
 
     def __getitem__(self, index):
-        info = self.nusc_infos[index]
-        lidar_path = info['lidar_path'][16:]
-        lidar_sd_token = self.nusc.get('sample', info['token'])['data']['LIDAR_TOP']
-        lidarseg_labels_filename = os.path.join(self.nusc.dataroot,
-                                                self.nusc.get('lidarseg', lidar_sd_token)['filename'])
+        lidar_path, lidarseg_labels_filename = self.paths[index]
+        prefetch_files([lidar_path, lidarseg_labels_filename])
+
+        points_label = np.fromfile(lidarseg_labels_filename, dtype=np.uint8)
+        points = np.fromfile(lidar_path, dtype=np.float32, count=-1).reshape([-1, 5])
+        # nb_assemble_points indexes the labels by point without bounds checking
+        if points_label.shape[0] != points.shape[0]:
+            raise Exception('%s has %d labels for %d points' % (lidarseg_labels_filename, points_label.shape[0],
+                                                                points.shape[0]))
+
+        # split the interleaved (x, y, z, intensity, ring) points into contiguous xyz and ref
+        xyz = np.empty((points.shape[0], 3), dtype=np.float32)
+        ref = np.empty((points.shape[0],), dtype=np.float32)
+        annotated_data = np.empty((points.shape[0],), dtype=np.uint8)
+        nb_assemble_points(points, points_label, self.learning_map_lut, xyz, ref, annotated_data)
+
+        return Sample(xyz, annotated_data.reshape([-1, 1]), ref if self.return_ref else None)
+
+
+def prefetch_files(paths):
+    # start kernel readahead for all files of a sample at once, so the reads overlap
+    # instead of each one blocking in turn when it is first touched
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
 
-        points_label = np.fromfile(lidarseg_labels_filename, dtype=np.uint8).reshape([-1, 1])
-        points_label = np.vectorize(self.learning_map.__getitem__)(points_label)
-        points = np.fromfile(os.path.join(self.data_path, lidar_path), dtype=np.float32, count=-1).reshape([-1, 5])
 
-        data_tuple = (points[:, :3], points_label.astype(np.uint8))
-        if self.return_ref:
-            data_tuple += (points[:, 3],)
-        return data_tuple
+def absoluteFilePaths(directory):
+    # iterative scandir walk (same entries as os.walk), sorted so the sample order is reproducible
+    stack = [os.path.abspath(directory)]
+    paths = []
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    paths.append(entry.path)
+    return sorted(paths)
+
+
+DENSE_XYZ_FIELDS = ("sensorX_1", "sensorY_1", "sensorZ_1")
+DENSE_FEA_FIELDS = ("distance_m_1", "intensity_1", "labels_1")
+DENSE_FIELDS = DENSE_XYZ_FIELDS + DENSE_FEA_FIELDS
+
+
+DENSE_PACKED_FIELD = "points"
+
+
+def open_dense_file(path):
+    # every DENSE frame is its own file, so there is no handle worth keeping open across samples;
+    # size the chunk cache so a whole frame (incl. a repacked single chunk) is decoded only once
+    return h5py.File(path, "r", rdcc_nbytes=8 * 1024 * 1024, rdcc_nslots=521)
+
+
+def read_dense_fields(f):
+    # every field is read straight into its row of a (6, H*W) float32 buffer (one read for a
+    # repacked frame), then xyz is copied out once into a C-contiguous (N, 3) array
+    if DENSE_PACKED_FIELD in f:
+        # file rewritten by repack_dense.py: all fields in a single (6, H, W) dataset
+        _, h, w = f[DENSE_PACKED_FIELD].shape
+        raw_data = np.empty((len(DENSE_FIELDS), h * w), dtype=np.float32)
+        f[DENSE_PACKED_FIELD].read_direct(raw_data.reshape(-1, h, w))
+    else:
+        h, w = f[DENSE_FIELDS[0]].shape
+        raw_data = np.empty((len(DENSE_FIELDS), h * w), dtype=np.float32)
+        for i, name in enumerate(DENSE_FIELDS):
+            f[name].read_direct(raw_data[i].reshape(h, w))
 
+    xyz = np.empty((h * w, len(DENSE_XYZ_FIELDS)), dtype=np.float32)
+    np.copyto(xyz, raw_data[:len(DENSE_XYZ_FIELDS)].T)
+    return xyz, raw_data[len(DENSE_XYZ_FIELDS):]
 
-def absoluteFilePaths(directory):
-    for dirpath, _, filenames in os.walk(directory):
-        for f in filenames:
-            yield os.path.abspath(os.path.join(dirpath, f))
+
+# signatures given up front: compiled (and cached) at import, never on the first sample.
+# uint16 labels for SemanticKITTI, uint8 for nuScenes lidarseg
+@nb.jit(['void(f4[:,:],u2[:],u1[:],f4[:,:],f4[:],u1[:])',
+         'void(f4[:,:],u1[:],u1[:],f4[:,:],f4[:],u1[:])'], nopython=True, cache=True, parallel=False)
+def nb_assemble_points(raw_data, point_label, learning_map_lut, xyz, ref, annotated_data):
+    # single pass over the points: split x,y,z,intensity into contiguous arrays and remap the label
+    for i in range(raw_data.shape[0]):
+        xyz[i, 0] = raw_data[i, 0]
+        xyz[i, 1] = raw_data[i, 1]
+        xyz[i, 2] = raw_data[i, 2]
+        ref[i] = raw_data[i, 3]
+        annotated_data[i] = learning_map_lut[point_label[i]]
+
+
+def build_learning_map_lut(learning_map, size=None):
+    # dense lookup table so that the label remap is a single numpy gather
+    if size is None:
+        size = max(learning_map.keys()) + 1
+    lut = np.zeros(size, dtype=np.uint8)
+    for k, v in learning_map.items():
+        lut[k] = v
+    return lut
+
+
+# labels of the unannotated test split
+ZERO_LABEL_LUT = np.zeros(1, dtype=np.uint8)
+
+# SemKITTI2train on already remapped uint8 labels: 0 (unlabeled) -> 255 (ignore), others -1
+SemKITTI2train_lut = np.full(256, 255, dtype=np.uint8)
+SemKITTI2train_lut[1:] = np.arange(255, dtype=np.uint8)
 
 
 def SemKITTI2train(label):
@@ -230,17 +370,22 @@ def SemKITTI2train(label):
 
 
 def SemKITTI2train_single(label):
-    remove_ind = label == 0
-    label -= 1
-    label[remove_ind] = 255
+    label[...] = SemKITTI2train_lut[label]
     return label
 
 
 # load Semantic KITTI class info
 
-def get_SemKITTI_label_name(label_mapping):
+@functools.lru_cache(maxsize=8)
+def _load_label_mapping(label_mapping, mtime):
+    # mtime is part of the cache key so an edited mapping file is re-read
     with open(label_mapping, 'r') as stream:
-        semkittiyaml = yaml.safe_load(stream)
+        return yaml.load(stream, Loader=YamlLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _SemKITTI_label_name(label_mapping, mtime):
+    semkittiyaml = _load_label_mapping(label_mapping, mtime)
     SemKITTI_label_name = dict()
     for i in sorted(list(semkittiyaml['learning_map'].keys()))[::-1]:
         SemKITTI_label_name[semkittiyaml['learning_map'][i]] = semkittiyaml['labels'][i]
@@ -248,9 +393,13 @@ def get_SemKITTI_label_name(label_mapping):
     return SemKITTI_label_name
 
 
-def get_nuScenes_label_name(label_mapping):
-    with open(label_mapping, 'r') as stream:
-        nuScenesyaml = yaml.safe_load(stream)
+def get_SemKITTI_label_name(label_mapping):
+    return dict(_SemKITTI_label_name(label_mapping, os.path.getmtime(label_mapping)))
+
+
+@functools.lru_cache(maxsize=8)
+def _nuScenes_label_name(label_mapping, mtime):
+    nuScenesyaml = _load_label_mapping(label_mapping, mtime)
     nuScenes_label_name = dict()
     for i in sorted(list(nuScenesyaml['learning_map'].keys()))[::-1]:
         val_ = nuScenesyaml['learning_map'][i]
@@ -258,6 +407,10 @@ def get_nuScenes_label_name(label_mapping):
 
     return nuScenes_label_name
 
+
+def get_nuScenes_label_name(label_mapping):
+    return dict(_nuScenes_label_name(label_mapping, os.path.getmtime(label_mapping)))
+
 if __name__ == "__main__":
     from collections import Counter
    # data = SemKITTI_sk(r"/home/jinwei/SemanticKitti/dataset/sequences",label_mapping="/mrtstorage/users/jinwei/Cylinder3D/config/label_mapping/semantic-kitti.yaml")
@@ -267,5 +420,5 @@ if __name__ == "__main__":
    # print(Counter(label.flatten().tolist()))
     data = CycleDense(r"/home/jinwei/dense",label_mapping=r"/home/jinwei/Cylinder3D/config/label_mapping/cycledense.yaml")
     print(data.__len__())
-    xyz,ref = data[0]
+    xyz, _, ref = data[0]
     print(xyz.shape,ref.shape)
@@ -0,0 +1,55 @@
+# -*- coding:utf-8 -*-
+# @file: repack_dense.py
+
+"""
+Rewrite DENSE hdf5 frames so that the six point fields live in one
+uncompressed, single-chunk (6, H, W) float32 dataset. Dense/CycleDense pick
+up the repacked layout automatically and load a frame with a single read.
+"""
+
+import os
+import argparse
+import sys
+import h5py
+from tqdm import tqdm
+
+from dataloader.pc_dataset import DENSE_FIELDS, DENSE_PACKED_FIELD
+
+
+def repack_file(src, dst, compression=None):
+    with h5py.File(src, "r") as f_src, h5py.File(dst, "w") as f_dst:
+        h, w = f_src[DENSE_FIELDS[0]].shape
+        points = f_dst.create_dataset(DENSE_PACKED_FIELD, shape=(len(DENSE_FIELDS), h, w), dtype='f4',
+                                      chunks=(len(DENSE_FIELDS), h, w), compression=compression)
+        for i, name in enumerate(DENSE_FIELDS):
+            points[i] = f_src[name][()]
+
+
+def main(args):
+    src_root = os.path.abspath(args.src)
+    dst_root = os.path.abspath(args.dst)
+    compression = None if args.compression == 'none' else args.compression
+
+    files = []
+    for dirpath, _, filenames in os.walk(src_root):
+        for f in filenames:
+            path = os.path.join(dirpath, f)
+            if h5py.is_hdf5(path):
+                files.append(path)
+
+    for src in tqdm(sorted(files)):
+        dst = os.path.join(dst_root, os.path.relpath(src, src_root))
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        repack_file(src, dst, compression=compression)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='')
+    parser.add_argument('-s', '--src', required=True, help='root of the original DENSE data')
+    parser.add_argument('-d', '--dst', required=True, help='root to write the repacked data to')
+    parser.add_argument('-c', '--compression', default='none', choices=['none', 'lzf'])
+    args = parser.parse_args()
+
+    print(' '.join(sys.argv))
+    print(args)
+    main(args)